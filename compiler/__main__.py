@@ -1,3 +1,5 @@
+import gc
+
 import fire
 
 from .language_models import program as program_module
@@ -13,8 +15,20 @@ def main(package_path: str, entrypoint: str = 'main.main'):
     entrypoint_module_path = tuple(entrypoint_module_path.split('.'))
 
     module = program.get_module(entrypoint_module_path)
-    method = getattr(module, entrypoint_method_name)
-    method()
+
+    # gc.freeze() moves every object tracked so far, mostly the parsed modules, into
+    # the permanent generation, which the cyclic garbage collector never scans, so
+    # collections while the program runs only look at newer objects. Collect first,
+    # so the garbage left over from parsing is not frozen along with them.
+    gc.collect()
+    gc.freeze()
+    try:
+        method = getattr(module, entrypoint_method_name)
+        method()
+    finally:
+        # Leave the garbage collector as it was, in case main is called from Python.
+        gc.unfreeze()
 
 
-fire.Fire(main)
+if __name__ == '__main__':
+    fire.Fire(main)
@@ -0,0 +1,27 @@
+import contextlib
+import gc
+import io
+import os
+import tempfile
+import unittest
+
+from . import __main__ as main_module
+
+
+class MainTestCase(unittest.TestCase):
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as package_path:
+            with open(os.path.join(package_path, 'main.sib'), 'w', encoding='utf-8') as file:
+                file.write(
+                    'def main():\n'
+                    '    print(\'hello\')\n'
+                )
+
+            freeze_count = gc.get_freeze_count()
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                main_module.main(package_path)
+
+        self.assertEqual('hello', output.getvalue().splitlines()[-1])
+        # The garbage collector is left as it was.
+        self.assertEqual(freeze_count, gc.get_freeze_count())
@@ -1,30 +1,36 @@
 import abc
+import operator as operator_module
 import typing
 
 import attr
 
 from . import program, string, types
+from ...meta import validators
 
 
 @attr.s(frozen=True, slots=True)
 class Expression(program.ProgramPartBase, metaclass=abc.ABCMeta):
     """Represents an expression.
     """
+    _rendering: typing.Optional[tuple] = program.cache_slot()
 
     @abc.abstractmethod
-    def render_expression(self) -> typing.Generator[str, None, None]:
+    def render_expression(self) -> typing.Sequence:
         """Render the expression.
         """
         raise NotImplementedError
 
 
+_memoize_rendering = program.cached_in('_rendering', tuple)
+
+
 @attr.s(frozen=True, slots=True)
 class LiteralExpression(Expression, metaclass=abc.ABCMeta):
     """Represents a literal expression.
     """
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class IntegerLiteral(LiteralExpression):
     """Represents an integer literal expression.
     """
@@ -32,14 +38,19 @@ class IntegerLiteral(LiteralExpression):
     width: int = attr.ib(validator=attr.validators.in_([16, 32, 64]))
     signed: bool = attr.ib(validator=attr.validators.instance_of(bool))
 
+    _suffixes = {
+        # (width, signed): suffix
+        (16, True): '',
+        (32, True): 'l',
+        (64, True): 'll',
+        (16, False): 'u',
+        (32, False): 'ul',
+        (64, False): 'ull',
+    }
+
+    @_memoize_rendering
     def render_expression(self):
-        sign_suffix = '' if self.signed else 'u'
-        width_suffix = {
-            16: '',
-            32: 'l',
-            64: 'll',
-        }[self.width]
-        yield f'{self.value}{sign_suffix}{width_suffix}'
+        yield f'{self.value}{self._suffixes[self.width, self.signed]}'
 
     @width.default
     def _init_width(self):
@@ -68,7 +79,7 @@ class IntegerLiteral(LiteralExpression):
             raise ValueError(f'value {value} out of range (signed={self.signed}, width={self.width})')
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class BytesLiteral(LiteralExpression):
     """Represents a character literal expression representing raw bytes (not unicode).
     """
@@ -76,6 +87,7 @@ class BytesLiteral(LiteralExpression):
 
     chunk_size: int = attr.ib(validator=attr.validators.instance_of(int), default=80)
 
+    @_memoize_rendering
     def render_expression(self):
         chunks = [self.value[i:i + self.chunk_size] for i in range(0, len(self.value), self.chunk_size)]
 
@@ -91,117 +103,99 @@ class BytesLiteral(LiteralExpression):
                     yield self.indent, escaped_chunk
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Call(Expression):
     """Represents an function call, i.e. ``my_function(arguments...)``.
     """
     function: Expression = attr.ib(validator=attr.validators.instance_of(Expression))
     arguments: typing.Sequence[Expression] = attr.ib(
-        validator=attr.validators.deep_iterable(
-            member_validator=attr.validators.instance_of(Expression),
-            iterable_validator=attr.validators.instance_of(tuple),
-        ),
+        validator=validators.members_instance_of(Expression),
         converter=tuple,
     )
 
+    @_memoize_rendering
     def render_expression(self):
-        function_rendering = list(self.function.render_expression())
-
-        for i, line in enumerate(function_rendering):
-            if i == len(function_rendering) - 1:
-                yield line, '('
-            else:
-                yield line
+        function_rendering = tuple(self.function.render_expression())
+        yield from function_rendering[:-1]
+        yield function_rendering[-1], '('
 
         for arg_index, argument in enumerate(self.arguments):
-            argument_rendering = list(argument.render_expression())
-            for i, line in enumerate(argument_rendering):
-                if i == len(argument_rendering) - 1 and arg_index < len(self.arguments) - 1:
-                    yield self.indent, line, ','
-                else:
-                    yield self.indent, line
+            argument_rendering = tuple(argument.render_expression())
+            for line in argument_rendering[:-1]:
+                yield self.indent, line
+
+            if arg_index < len(self.arguments) - 1:
+                yield self.indent, argument_rendering[-1], ','
+            else:
+                yield self.indent, argument_rendering[-1]
 
         yield ')'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True)  # no cache_hash, so it can be mixed in without a slot conflict
 class LValueExpression(Expression, metaclass=abc.ABCMeta):
     """Represents an expression which can appear on the left side of an assignment operator.
     """
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Variable(LValueExpression):
     """Represents a variable.
     """
     name: str = attr.ib(validator=attr.validators.instance_of(str))
 
+    @_memoize_rendering
     def render_expression(self):
         yield self.name
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Dot(LValueExpression):
     """Represents member dereference, i.e. ``my_struct.my_member``.
     """
     operand: Expression = attr.ib(validator=attr.validators.instance_of(Expression))
     member: str = attr.ib(validator=attr.validators.instance_of(str))
 
+    @_memoize_rendering
     def render_expression(self):
-        operand_rendering = list(self.operand.render_expression())
-
-        for i, line in enumerate(operand_rendering):
-            if i == len(operand_rendering) - 1:
-                yield line, '.', self.member
-            else:
-                yield line
+        operand_rendering = tuple(self.operand.render_expression())
+        yield from operand_rendering[:-1]
+        yield operand_rendering[-1], '.', self.member
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Subscript(LValueExpression):
     """Represents an array subscript, i.e. ``my_array[123]``.
     """
     operand: Expression = attr.ib(validator=attr.validators.instance_of(Expression))
     subscript: Expression = attr.ib(validator=attr.validators.instance_of(Expression))
 
+    @_memoize_rendering
     def render_expression(self):
-        operand_rendering = list(self.operand.render_expression())
-        subscript_rendering = list(self.subscript.render_expression())
-        subscript_rendering_iterator = iter(subscript_rendering)
-
-        for i, line in enumerate(operand_rendering):
-            if i == len(operand_rendering) - 1:
-                if len(subscript_rendering) == 1:
-                    # pylint: disable=stop-iteration-return
-                    yield line, '[', next(subscript_rendering_iterator), ']'
-                else:
-                    # pylint: disable=stop-iteration-return
-                    yield line, '[', next(subscript_rendering_iterator)
-            else:
-                yield line
+        operand_rendering = tuple(self.operand.render_expression())
+        subscript_rendering = tuple(self.subscript.render_expression())
+        yield from operand_rendering[:-1]
 
-        for i, line in enumerate(subscript_rendering_iterator):
-            if i == len(operand_rendering) - 1:
-                yield line, ']'
-            else:
-                yield line
+        if len(subscript_rendering) == 1:
+            yield operand_rendering[-1], '[', subscript_rendering[0], ']'
+        else:
+            yield operand_rendering[-1], '[', subscript_rendering[0]
+            yield from subscript_rendering[1:-1]
+            yield subscript_rendering[-1], ']'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Arrow(LValueExpression):
     """Represents member dereference, i.e. ``my_struct.my_member``.
     """
     operand: Expression = attr.ib(validator=attr.validators.instance_of(Expression))
     member: str = attr.ib(validator=attr.validators.instance_of(str))
 
+    @_memoize_rendering
     def render_expression(self):
-        operand_rendering = list(self.operand.render_expression())
-
-        for i, line in enumerate(operand_rendering):
-            if i == len(operand_rendering) - 1:
-                yield line, '->', self.member
-            else:
-                yield line
+        operand_rendering = tuple(self.operand.render_expression())
+        yield from operand_rendering[:-1]
+        yield operand_rendering[-1], '->', self.member
 
 
 @attr.s(frozen=True, slots=True)
@@ -212,66 +206,64 @@ class UnaryOperatorExpression(Expression):
 
     operator = None  # override in subclass
 
+    @_memoize_rendering
     def render_expression(self):
-        operand_rendering = list(self.operand.render_expression())
-
-        for i, line in enumerate(operand_rendering):
-            if i == 0 and len(operand_rendering) == 1:
-                yield '(', self.operator, line, ')'
-            elif i == 0:
-                yield '(', self.operator, line
-            elif i == len(operand_rendering) - 1:
-                yield line, ')'
-            else:
-                yield line
+        operand_rendering = tuple(self.operand.render_expression())
+
+        if len(operand_rendering) == 1:
+            yield '(', self.operator, operand_rendering[0], ')'
+        else:
+            yield '(', self.operator, operand_rendering[0]
+            yield from operand_rendering[1:-1]
+            yield operand_rendering[-1], ')'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Increment(UnaryOperatorExpression):
     operator = '++'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Decrement(UnaryOperatorExpression):
     operator = '--'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class AddressOf(UnaryOperatorExpression):
     operator = '&'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Dereference(UnaryOperatorExpression, LValueExpression):
     operator = '*'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Positive(UnaryOperatorExpression):
     operator = '+'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Negative(UnaryOperatorExpression):
     operator = '-'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class BitwiseNot(UnaryOperatorExpression):
     operator = '~'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Not(UnaryOperatorExpression):
     operator = '!'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class SizeOf(UnaryOperatorExpression):
     operator = 'sizeof '
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Cast(UnaryOperatorExpression):
     type: types.TypeBase = attr.ib(validator=attr.validators.instance_of(types.TypeBase))
 
@@ -288,28 +280,55 @@ class BinaryOperationExpression(Expression, metaclass=abc.ABCMeta):
     right: Expression = attr.ib(validator=attr.validators.instance_of(Expression))
 
     operator = None  # override in subclass
+    constant_fold = None  # override in subclass to fold IntegerLiteral operands
+
+    @classmethod
+    def fold(cls, left: Expression, right: Expression) -> Expression:
+        """Construct the operation, folding it into a single IntegerLiteral if
+        both operands are IntegerLiterals of the same type.
+
+        Folding is opt-in: constructing the operation directly never folds.
 
+        Only operations with a ``constant_fold`` are folded, and only when the
+        result is representable without overflow; otherwise the C semantics are
+        left to the C compiler. Negative results are not folded either, because a
+        negative literal renders with a leading ``-``, which would run into a unary
+        operator applied to it (e.g. ``(--1)``).
+        """
+        if (
+                cls.constant_fold is not None
+                and isinstance(left, IntegerLiteral)
+                and isinstance(right, IntegerLiteral)
+                and left.width == right.width
+                and left.signed == right.signed
+        ):
+            value = cls.constant_fold(left.value, right.value)  # pylint: disable=not-callable
+            if value >= 0:
+                try:
+                    return IntegerLiteral(value, width=left.width, signed=left.signed)
+                except ValueError:
+                    pass
+
+        return cls(left=left, right=right)
+
+    @_memoize_rendering
     def render_expression(self):
-        for i, line in enumerate(self.left.render_expression()):
-            if i == 0:
-                yield '(', line
-            else:
-                yield line
+        left_rendering = tuple(self.left.render_expression())
+        yield '(', left_rendering[0]
+        yield from left_rendering[1:]
 
-        right_rendering = list(self.right.render_expression())
+        right_rendering = tuple(self.right.render_expression())
 
-        for i, line in enumerate(right_rendering):
-            if i == 0 and len(right_rendering) == 1:
-                yield self.indent, self.operator, ' ', line, ')'
-            elif i == 0:
-                yield self.indent, self.operator, ' ', line
-            elif i == len(right_rendering) - 1:
-                yield self.indent, line, ')'
-            else:
+        if len(right_rendering) == 1:
+            yield self.indent, self.operator, ' ', right_rendering[0], ')'
+        else:
+            yield self.indent, self.operator, ' ', right_rendering[0]
+            for line in right_rendering[1:-1]:
                 yield self.indent, line
+            yield self.indent, right_rendering[-1], ')'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Assign(BinaryOperationExpression):
     """Represents an assignment.
     """
@@ -319,91 +338,94 @@ class Assign(BinaryOperationExpression):
     operator = '='
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Multiply(BinaryOperationExpression):
     operator = '*'
+    constant_fold = operator_module.mul
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Mod(BinaryOperationExpression):
     operator = '%'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Divide(BinaryOperationExpression):
     operator = '/'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Add(BinaryOperationExpression):
     operator = '+'
+    constant_fold = operator_module.add
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Subtract(BinaryOperationExpression):
     operator = '-'
+    constant_fold = operator_module.sub
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class ShiftLeft(BinaryOperationExpression):
     operator = '<<'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class ShiftRight(BinaryOperationExpression):
     operator = '>>'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class LessThan(BinaryOperationExpression):
     operator = '<'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class GreaterThan(BinaryOperationExpression):
     operator = '>'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class LessThanOrEqual(BinaryOperationExpression):
     operator = '<='
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class GreaterThanOrEqual(BinaryOperationExpression):
     operator = '>='
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Equals(BinaryOperationExpression):
     operator = '=='
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class NotEquals(BinaryOperationExpression):
     operator = '!='
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class BitwiseAnd(BinaryOperationExpression):
     operator = '&'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class BitwiseOr(BinaryOperationExpression):
     operator = '|'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class BitwiseXor(BinaryOperationExpression):
     operator = '^'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class And(BinaryOperationExpression):
     operator = '&&'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Or(BinaryOperationExpression):
     operator = '||'
@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 
 from . import expression
@@ -214,6 +216,21 @@ class ExpressionTestCase(unittest.TestCase):
             list(expression.Variable(name='foo').render_expression())
         )
 
+    def test_render_expression_memoized(self):
+        dot = expression.Dot(
+            expression.Variable(name='foo'),
+            member='bar',
+        )
+
+        self.assertIs(dot.render_expression(), dot.render_expression())
+        self.assertIs(
+            dot.render_expression(),
+            expression.Dot(
+                expression.Variable(name='foo'),
+                member='bar',
+            ).render_expression(),
+        )
+
     def test_dot(self):
         self.assertEqual(
             [
@@ -328,6 +345,19 @@ class ExpressionTestCase(unittest.TestCase):
             ).render_expression())
         )
 
+        self.assertEqual(
+            [
+                '"aaaa"',
+                ('  ', '"bbbb"'),
+                (('  ', '"cccc"'), '[', '"xxxx"'),
+                (('  ', '"yyyy"'), ']')
+            ],
+            list(expression.Subscript(
+                expression.BytesLiteral(b'aaaabbbbcccc', 4),
+                expression.BytesLiteral(b'xxxxyyyy', 4),
+            ).render_expression())
+        )
+
     def test_unary_operators(self):
         all_unary_operators = [
             cls for cls in vars(expression).values()
@@ -396,6 +426,110 @@ class ExpressionTestCase(unittest.TestCase):
             ).render_expression())
         )
 
+    def test_constant_folding(self):
+        self.assertIs(
+            expression.IntegerLiteral(6),
+            expression.Multiply.fold(
+                left=expression.IntegerLiteral(2),
+                right=expression.IntegerLiteral(3),
+            )
+        )
+        self.assertIs(
+            expression.IntegerLiteral(12),
+            expression.Add.fold(
+                left=expression.IntegerLiteral(7),
+                right=expression.Subtract.fold(
+                    left=expression.IntegerLiteral(8),
+                    right=expression.IntegerLiteral(3),
+                ),
+            )
+        )
+
+        # Only arithmetic with Python-compatible semantics is folded.
+        self.assertIs(
+            expression.Divide(
+                left=expression.IntegerLiteral(7),
+                right=expression.IntegerLiteral(2),
+            ),
+            expression.Divide.fold(
+                left=expression.IntegerLiteral(7),
+                right=expression.IntegerLiteral(2),
+            )
+        )
+
+        # Overflow is left for the C compiler to deal with.
+        self.assertIs(
+            expression.Add(
+                left=expression.IntegerLiteral(32767),
+                right=expression.IntegerLiteral(1),
+            ),
+            expression.Add.fold(
+                left=expression.IntegerLiteral(32767),
+                right=expression.IntegerLiteral(1),
+            )
+        )
+
+        # Negative results are not folded, so they never render as a literal like -1.
+        self.assertIs(
+            expression.Subtract(
+                left=expression.IntegerLiteral(1),
+                right=expression.IntegerLiteral(2),
+            ),
+            expression.Subtract.fold(
+                left=expression.IntegerLiteral(1),
+                right=expression.IntegerLiteral(2),
+            )
+        )
+
+        # So are operands of different types.
+        self.assertIsInstance(
+            expression.Add.fold(
+                left=expression.IntegerLiteral(1, width=32),
+                right=expression.IntegerLiteral(1),
+            ),
+            expression.Add
+        )
+
+        # Constructing an operation directly never folds.
+        self.assertIsInstance(
+            expression.Multiply(
+                left=expression.IntegerLiteral(2),
+                right=expression.IntegerLiteral(3),
+            ),
+            expression.Multiply
+        )
+
+    def test_unary_operator_over_folded_operation(self):
+        difference = expression.Subtract.fold(
+            left=expression.IntegerLiteral(1),
+            right=expression.IntegerLiteral(2),
+        )
+
+        self.assertEqual(
+            [
+                ('(', '-', ('(', '1')),
+                (('  ', '-', ' ', '2', ')'), ')'),
+            ],
+            list(expression.Negative(difference).render_expression())
+        )
+        self.assertEqual(
+            [
+                ('(', '+', ('(', '1')),
+                (('  ', '-', ' ', '2', ')'), ')'),
+            ],
+            list(expression.Positive(difference).render_expression())
+        )
+
+    def test_binary_operation_copy(self):
+        add = expression.Add(
+            left=expression.Variable(name='a'),
+            right=expression.Variable(name='b'),
+        )
+
+        self.assertEqual(add, copy.copy(add))
+        self.assertEqual(add, copy.deepcopy(add))
+        self.assertEqual(add, pickle.loads(pickle.dumps(add)))
+
     def test_assign(self):
         self.assertEqual(
             [
@@ -5,28 +5,26 @@ import typing
 import attr
 
 from . import program, types, statement, include
+from ...meta import validators
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Function(program.ProgramPartBase):
     """Represents a function.
     """
 
-    @attr.s(frozen=True, slots=True)
+    @attr.s(frozen=True, slots=True, cache_hash=True)
     class Argument:
         """Represents a named and typed function argument.
         """
         name: str = attr.ib(validator=attr.validators.instance_of(str))
         type: types.TypeBase = attr.ib(validator=attr.validators.instance_of(types.TypeBase))
 
-    @attr.s(frozen=True, slots=True)
+    @attr.s(frozen=True, slots=True, cache_hash=True)
     class ForwardDeclaration(program.ProgramPartBase):
         name: str = attr.ib(validator=attr.validators.instance_of(str))
         argument_types: typing.Sequence[types.TypeBase] = attr.ib(
-            validator=attr.validators.deep_iterable(
-                member_validator=attr.validators.instance_of(types.TypeBase),
-                iterable_validator=attr.validators.instance_of(tuple),
-            ),
+            validator=validators.members_instance_of(types.TypeBase),
             converter=tuple,
         )
         return_type: types.TypeBase = attr.ib(validator=attr.validators.instance_of(types.TypeBase))
@@ -49,18 +47,12 @@ class Function(program.ProgramPartBase):
 
     name: str = attr.ib(validator=attr.validators.instance_of(str))
     arguments: typing.Sequence[Function.Argument] = attr.ib(
-        validator=attr.validators.deep_iterable(
-            member_validator=attr.validators.instance_of(Argument),
-            iterable_validator=attr.validators.instance_of(tuple),
-        ),
+        validator=validators.members_instance_of(Argument),
         converter=tuple,
     )
     return_type: types.TypeBase = attr.ib(validator=attr.validators.instance_of(types.TypeBase))
     statements: typing.Sequence[statement.Statement] = attr.ib(
-        validator=attr.validators.deep_iterable(
-            member_validator=attr.validators.instance_of(statement.Statement),
-            iterable_validator=attr.validators.instance_of(tuple),
-        ),
+        validator=validators.members_instance_of(statement.Statement),
         converter=tuple,
     )
 
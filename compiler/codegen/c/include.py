@@ -5,7 +5,7 @@ import attr
 from . import program
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Include(program.ProgramPartBase):
     """Represents an "include" directive.
     """
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import collections
+import functools
+import itertools
 import typing
 
 import attr
@@ -8,6 +9,36 @@ import attr
 from ...meta import instance_cache
 
 
+def cache_slot():
+    """Declare an attribute to hold a value stored by ``cached_in``.
+    """
+    return attr.ib(init=False, default=None, eq=False, repr=False)
+
+
+def cached_in(slot_name: str, converter: typing.Optional[typing.Callable] = None):
+    """Decorator which computes a method's result only once, since program parts are
+    immutable, and stores it in the attribute ``slot_name`` (see ``cache_slot``).
+
+    :param slot_name: the name of the attribute to store the result in
+    :param converter: applied to the result before storing it, e.g. ``tuple`` to store
+        the output of a generator
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def cached_method(self):
+            value = getattr(self, slot_name)
+            if value is None:
+                value = method(self)
+                if converter is not None:
+                    value = converter(value)
+                object.__setattr__(self, slot_name, value)
+            return value
+
+        return cached_method
+
+    return decorator
+
+
 @attr.s(frozen=True, slots=True)
 class ProgramPartBase(metaclass=instance_cache.InstanceCacheABCMeta):
     """Represents part of a C program.
@@ -16,79 +47,135 @@ class ProgramPartBase(metaclass=instance_cache.InstanceCacheABCMeta):
     suggested_line_length = 100
     class_dependencies = ()  # All instances of these classes are considered dependencies.
 
+    _rendered_lines: typing.Optional[typing.Tuple[str, ...]] = cache_slot()
+
     @property
-    def dependencies(self) -> typing.Generator[ProgramPartBase, None, None]:
-        """Yield all the direct dependencies.
+    def dependencies(self) -> typing.Iterable[ProgramPartBase]:
+        """All the direct dependencies.
         """
-        yield from []
+        return ()
 
     def render_program_part(self) -> typing.Generator[_NestedStrings, None, None]:
         """Render the program part as a sequence of strings (one per line).
         """
         yield from []
 
+    @property
+    @cached_in('_rendered_lines', tuple)
+    def rendered_lines(self) -> typing.Tuple[str, ...]:
+        """The flattened lines of ``render_program_part``.
+        """
+        return (''.join(_flatten(line)) for line in self.render_program_part())
+
 
 @attr.s(frozen=True, slots=True)
 class Program:
     """Represents a program.
     """
-    _parts_by_class: typing.DefaultDict[type, typing.Dict[ProgramPartBase, None]] = attr.ib(
-        factory=lambda: collections.defaultdict(dict),  # dict reproduces insertion order on iteration
+    _parts_by_class: typing.Dict[type, typing.Dict[ProgramPartBase, None]] = attr.ib(
+        factory=dict,  # dict reproduces insertion order on iteration
         init=False,
     )
 
     def add(self, program_part: ProgramPartBase):
-        for dependency in program_part.dependencies:
-            if dependency not in self._parts_by_class[type(program_part)]:
-                self.add(dependency)
-
-        self._parts_by_class[type(program_part)][program_part] = None
+        # Depth-First Search with an explicit stack, so each part is added after
+        # its dependencies. Parts still on the stack are skipped rather than
+        # revisited; any cycle is reported later by program_parts.
+        parts_by_class = self._parts_by_class
+        # Classes are ordered by when a part of that class is first added, before
+        # its dependencies are; program_parts sorts one class at a time in that order.
+        parts_by_class.setdefault(type(program_part), {})
+        pending = {program_part}
+        stack = [(program_part, iter(program_part.dependencies))]
+
+        while stack:
+            part, dependencies = stack[-1]
+            for dependency in dependencies:
+                if dependency not in parts_by_class.get(type(dependency), ()) and dependency not in pending:
+                    parts_by_class.setdefault(type(dependency), {})
+                    pending.add(dependency)
+                    stack.append((dependency, iter(dependency.dependencies)))
+                    break
+            else:
+                stack.pop()
+                parts_by_class[type(part)][part] = None
 
     def __iter__(self) -> typing.Generator[str, None, None]:
         """Iterator to render the program line by line.
         """
         for program_part in self.program_parts:
-            for line in program_part.render_program_part():
-                yield ''.join(_flatten(line))
+            yield from program_part.rendered_lines
+
+    def render(self) -> str:
+        """Render the whole program as a single string.
+        """
+        return '\n'.join(itertools.chain.from_iterable(
+            program_part.rendered_lines for program_part in self.program_parts
+        ))
 
     @property
     def program_parts(self):
         """Iterator over all the program parts in order of dependencies.
         """
-        visited = set()  # Halt depth-first search if we hit a part we've already returned.
-        ancestors = set()  # Detect dependency cycles.
-
-        def sort_program_parts(program_parts):
-            """Topological sort based on Depth-First Search.
-            """
-            for program_part in program_parts:
-                if program_part not in visited:
-                    if program_part in ancestors:
-                        raise RuntimeError('cycle detected in dependency graph')
-
-                    ancestors.add(program_part)
-                    # Expand class dependencies to all instances of that class and recursively sort.
-                    for class_dependency in program_part.class_dependencies:
-                        yield from sort_program_parts(self._parts_by_class[class_dependency])
-                    # Recursively sort instance dependencies.
-                    yield from sort_program_parts(program_part.dependencies)
-                    ancestors.remove(program_part)
-
-                    visited.add(program_part)
+        # Each part is either being sorted (an ancestor of the current part, so seeing
+        # it again means there is a cycle) or already returned (so skip it).
+        sorted_parts: typing.Dict[ProgramPartBase, bool] = {}  # part -> is it returned yet?
+
+        # Parts are sorted starting with each class in order, so that parts of the
+        # same class stay together.
+        parts_by_class = self._parts_by_class
+
+        # Topological sort based on Depth-First Search. The explicit stack holds each
+        # part being sorted, with an iterator over its remaining dependencies; the
+        # bottom entry iterates over every part in the program.
+        stack = [(None, itertools.chain.from_iterable(parts_by_class.values()))]
+
+        while stack:
+            program_part, dependencies = stack[-1]
+            dependency = next(dependencies, None)
+
+            if dependency is None:
+                stack.pop()
+                if program_part is not None:
+                    sorted_parts[program_part] = True
                     yield program_part
 
-        for part_class in self._parts_by_class.keys():
-            yield from sort_program_parts(self._parts_by_class[part_class])
+            else:
+                returned = sorted_parts.get(dependency)
+                if returned:
+                    continue
+                if returned is not None:
+                    raise RuntimeError('cycle detected in dependency graph')
+
+                sorted_parts[dependency] = False
+                stack.append((dependency, itertools.chain(
+                    # Expand class dependencies to all instances of that class.
+                    *(parts_by_class.get(class_dependency, ())
+                      for class_dependency in dependency.class_dependencies),
+                    dependency.dependencies,
+                )))
 
 
 _NestedStrings = typing.Union[str, typing.Sequence['_NestedStrings']]
 
 
-def _flatten(nested_strings: _NestedStrings) -> typing.Generator[str, None, None]:
-    """Flatten a nested tuple of strings into a tuple of strings.
+def _flatten(nested_strings: _NestedStrings) -> typing.List[str]:
+    """Flatten a nested tuple of strings into a list of strings.
     """
     if isinstance(nested_strings, str):
-        yield nested_strings
-    else:
-        for item in nested_strings:
-            yield from _flatten(item)
+        return [nested_strings]
+
+    strings = []
+    stack = [iter(nested_strings)]  # Explicit stack of partly flattened sequences.
+
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, str):
+                strings.append(item)
+            else:
+                stack.append(iter(item))
+                break
+        else:
+            stack.pop()
+
+    return strings
@@ -1,7 +1,9 @@
 import textwrap
 import unittest
 
-from . import program, function, statement, expression
+import attr
+
+from . import program, function, statement, expression, types
 from .types import integer
 
 
@@ -82,3 +84,74 @@ class ProgramTestCase(unittest.TestCase):
             ''').strip(),
             '\n'.join(my_program)
         )
+        self.assertEqual('\n'.join(my_program), my_program.render())
+
+    def test_rendered_lines(self):
+        my_program = program.Program()
+        my_program.add(_Numbered(0, 3))
+
+        self.assertEqual(['2', '1', '0'], list(my_program))
+        self.assertEqual(['2', '1', '0'], list(my_program))
+        self.assertIs(_Numbered(0, 3).rendered_lines, _Numbered(0, 3).rendered_lines)
+
+    def test_program_parts_class_order(self):
+        my_program = program.Program()
+        # Struct is added before its Pointer dependency, so all the Structs
+        # are sorted before the remaining Pointers.
+        my_program.add(types.Struct('s1', [types.Struct.Field('x', integer.Char().pointer)]))
+        my_program.add(integer.Int8T().pointer)
+
+        self.assertEqual(
+            [
+                '#include <stdint.h>',
+                'typedef char *_char_Ptr;',
+                'typedef struct {',
+                '  _char_Ptr x;',
+                '} s1;',
+                'typedef int8_t *_int8_t_Ptr;',
+            ],
+            list(my_program)
+        )
+
+    def test_program_parts_deep(self):
+        my_program = program.Program()
+        my_program.add(_Numbered(0, 5000))  # deeper than the recursion limit
+
+        self.assertEqual(
+            [_Numbered(number, 5000) for number in reversed(range(5000))],
+            list(my_program.program_parts),
+        )
+
+    def test_program_parts_cycle(self):
+        my_program = program.Program()
+        my_program.add(_Numbered(0, 2, cycle=True))
+
+        with self.assertRaisesRegex(RuntimeError, 'cycle detected'):
+            list(my_program.program_parts)
+
+    def test_flatten(self):
+        # pylint: disable=protected-access
+        self.assertEqual(['foo'], program._flatten('foo'))
+        self.assertEqual(
+            ['  ', '(', 'foo', '  ', '=', ' ', 'bar', ')', ';'],
+            program._flatten((('  ', (('(', 'foo'), (), ('  ', ('=', ' ', 'bar')), ')')), ';')),
+        )
+
+
+@attr.s(frozen=True, slots=True)
+class _Numbered(program.ProgramPartBase):
+    """Depends on the part numbered one higher, up to ``count`` parts.
+    """
+    number: int = attr.ib()
+    count: int = attr.ib()
+    cycle: bool = attr.ib(default=False)
+
+    @property
+    def dependencies(self):
+        if self.number + 1 < self.count:
+            yield _Numbered(self.number + 1, self.count, self.cycle)
+        elif self.cycle:
+            yield _Numbered(0, self.count, self.cycle)
+
+    def render_program_part(self):
+        yield str(self.number)
@@ -4,21 +4,26 @@ import typing
 import attr
 
 from . import program, expression as expression_module, types
+from ...meta import validators
 
 
 @attr.s(frozen=True, slots=True)
 class Statement(program.ProgramPartBase, metaclass=abc.ABCMeta):
     """Represents a statement.
     """
+    _rendering: typing.Optional[tuple] = program.cache_slot()
 
     @abc.abstractmethod
-    def render_statement(self) -> typing.Generator[str, None, None]:
+    def render_statement(self) -> typing.Sequence:
         """Render the statement.
         """
         raise NotImplementedError
 
 
-@attr.s(frozen=True, slots=True)
+_memoize_rendering = program.cached_in('_rendering', tuple)
+
+
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class DeclarationStatement(Statement):
     """Represents a variable declaration.
     """
@@ -29,11 +34,12 @@ class DeclarationStatement(Statement):
     def dependencies(self):
         yield self.type
 
+    @_memoize_rendering
     def render_statement(self):
         yield self.type.name, ' ', self.name, ';'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class ExpressionStatement(Statement):
     """Represents a statement consisting of an expression.
     """
@@ -41,18 +47,14 @@ class ExpressionStatement(Statement):
         validator=attr.validators.instance_of(expression_module.Expression)
     )
 
+    @_memoize_rendering
     def render_statement(self):
-        last_line = None
-
-        for line in self.expression.render_expression():
-            if last_line is not None:
-                yield last_line
-            last_line = line
+        rendering = tuple(self.expression.render_expression())
+        yield from rendering[:-1]
+        yield rendering[-1], ';'
 
-        yield last_line, ';'
 
-
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class ReturnStatement(Statement):
     """Represents a return statement.
     """
@@ -61,53 +63,51 @@ class ReturnStatement(Statement):
         default=None,
     )
 
+    @_memoize_rendering
     def render_statement(self):
         if self.expression is None:
             yield 'return;'
         else:
-            rendering = list(self.expression.render_expression())
-
-            for i, line in enumerate(rendering):
-                if len(rendering) == 1:
-                    yield 'return ', line, ';'
-                elif i == 0:
-                    yield 'return ', line
-                elif i == len(rendering) - 1:
-                    yield line, ';'
-                else:
-                    yield line
+            rendering = tuple(self.expression.render_expression())
+
+            if len(rendering) == 1:
+                yield 'return ', rendering[0], ';'
+            else:
+                yield 'return ', rendering[0]
+                yield from rendering[1:-1]
+                yield rendering[-1], ';'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class ContinueStatement(Statement):
     """Represents a continue statement.
     """
 
+    @_memoize_rendering
     def render_statement(self):
         yield 'continue;'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class BreakStatement(Statement):
     """Represents a break statement.
     """
 
+    @_memoize_rendering
     def render_statement(self):
         yield 'break;'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class BlockStatement(Statement):
     """Represents a code block.
     """
     statements: typing.Sequence[Statement] = attr.ib(
-        validator=attr.validators.deep_iterable(
-            member_validator=attr.validators.instance_of(Statement),
-            iterable_validator=attr.validators.instance_of(tuple),
-        ),
+        validator=validators.members_instance_of(Statement),
         converter=tuple,
     )
 
+    @_memoize_rendering
     def render_statement(self):
         yield '{'
 
@@ -118,7 +118,7 @@ class BlockStatement(Statement):
         yield '}'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class IfStatement(Statement):
     """Represents an if statement.
     """
@@ -131,6 +131,7 @@ class IfStatement(Statement):
         default=None,
     )
 
+    @_memoize_rendering
     def render_statement(self):
         yield 'if ('
         for line in self.condition.render_expression():
@@ -150,7 +151,7 @@ class IfStatement(Statement):
                     yield line
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class WhileStatement(Statement):
     """Represents a while statement.
     """
@@ -159,6 +160,7 @@ class WhileStatement(Statement):
     )
     body: Statement = attr.ib(validator=attr.validators.instance_of(Statement))
 
+    @_memoize_rendering
     def render_statement(self):
         yield 'while ('
         for line in self.condition.render_expression():
@@ -171,7 +173,7 @@ class WhileStatement(Statement):
                 yield line
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class DoWhileStatement(Statement):
     """Represents a "do while" statement.
     """
@@ -180,6 +182,7 @@ class DoWhileStatement(Statement):
     )
     body: Statement = attr.ib(validator=attr.validators.instance_of(Statement))
 
+    @_memoize_rendering
     def render_statement(self):
         for i, line in enumerate(self.body.render_statement()):
             if i == 0:
@@ -193,29 +196,30 @@ class DoWhileStatement(Statement):
         yield ');'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class SwitchStatement(Statement):
     """Represents a switch statement.
     """
-    @attr.s(frozen=True, slots=True)
+    @attr.s(frozen=True, slots=True, cache_hash=True)
     class Case:
         values: typing.Collection[expression_module.IntegerLiteral] = attr.ib(
-            validator=attr.validators.deep_iterable(
-                member_validator=attr.validators.instance_of(expression_module.IntegerLiteral),
-                iterable_validator=attr.validators.instance_of(frozenset),
-            ),
+            validator=validators.members_instance_of(expression_module.IntegerLiteral),
             converter=frozenset,
         )
         consequence: Statement = attr.ib(validator=attr.validators.instance_of(Statement))
+        sorted_values: typing.Tuple[expression_module.IntegerLiteral, ...] = attr.ib(
+            init=False, eq=False, repr=False,
+        )
+
+        @sorted_values.default
+        def _init_sorted_values(self):
+            return tuple(sorted(self.values))
 
     switch: expression_module.Expression = attr.ib(
         validator=attr.validators.instance_of(expression_module.Expression)
     )
     cases: typing.Sequence[Case] = attr.ib(
-        validator=attr.validators.deep_iterable(
-            member_validator=attr.validators.instance_of(Case),
-            iterable_validator=attr.validators.instance_of(tuple),
-        ),
+        validator=validators.members_instance_of(Case),
         converter=tuple,
     )
     default: typing.Optional[Statement] = attr.ib(
@@ -223,6 +227,7 @@ class SwitchStatement(Statement):
         default=None,
     )
 
+    @_memoize_rendering
     def render_statement(self):
         yield 'switch ('
         for line in self.switch.render_expression():
@@ -230,7 +235,7 @@ class SwitchStatement(Statement):
         yield ') {'
 
         for case in self.cases:
-            for integer_literal_expression in sorted(case.values):
+            for integer_literal_expression in case.sorted_values:
                 for line in integer_literal_expression.render_expression():
                     yield self.indent, 'case ', line, ':'
 
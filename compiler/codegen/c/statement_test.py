@@ -89,6 +89,19 @@ class StatementTestCase(unittest.TestCase):
             list(statement.BreakStatement().render_statement())
         )
 
+    def test_render_statement_memoized(self):
+        block = statement.BlockStatement([
+            statement.ReturnStatement(expression.Variable(name='foo')),
+        ])
+
+        self.assertIs(block.render_statement(), block.render_statement())
+        self.assertIs(
+            block.render_statement(),
+            statement.BlockStatement([
+                statement.ReturnStatement(expression.Variable(name='foo')),
+            ]).render_statement(),
+        )
+
     def test_block_statement(self):
         self.assertEqual(
             [
@@ -124,6 +137,10 @@ class StatementTestCase(unittest.TestCase):
             ]).render_statement())
         )
 
+    def test_block_statement_validation(self):
+        with self.assertRaisesRegex(TypeError, "'statements' must be"):
+            statement.BlockStatement([statement.ReturnStatement(), 'return;'])
+
     def test_if_statement(self):
         self.assertEqual(
             [
@@ -300,3 +317,25 @@ class StatementTestCase(unittest.TestCase):
                 default=statement.BlockStatement([statement.ReturnStatement()])
             ).render_statement())
         )
+
+    def test_switch_case_sorted_values(self):
+        case = statement.SwitchStatement.Case(
+            values=[
+                expression.IntegerLiteral(3),
+                expression.IntegerLiteral(1),
+                expression.IntegerLiteral(2),
+            ],
+            consequence=statement.ReturnStatement(),
+        )
+
+        self.assertEqual(
+            (expression.IntegerLiteral(1), expression.IntegerLiteral(2), expression.IntegerLiteral(3)),
+            case.sorted_values,
+        )
+        self.assertEqual(
+            statement.SwitchStatement.Case(
+                values=[expression.IntegerLiteral(1), expression.IntegerLiteral(2), expression.IntegerLiteral(3)],
+                consequence=statement.ReturnStatement(),
+            ),
+            case,
+        )
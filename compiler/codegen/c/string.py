@@ -1,5 +1,5 @@
 def escape_bytes(buffer: bytes) -> str:
-    return ''.join(_escapes[c] for c in buffer)
+    return ''.join(map(_escapes.__getitem__, buffer))
 
 
 _escapes = [
@@ -6,6 +6,7 @@ import typing
 import attr
 
 from .. import include, program
+from ....meta import instance_cache, validators
 
 
 @attr.s(frozen=True, slots=True)
@@ -28,45 +29,48 @@ class TypeBase(program.ProgramPartBase, metaclass=abc.ABCMeta):
     class_dependencies = (include.Include,)
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Void(TypeBase):
     """Represents a types with no data, void.
     """
     name = 'void'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Pointer(TypeBase):
     """Represents a pointer types.
     """
     contained_type: TypeBase = attr.ib(validator=attr.validators.instance_of(TypeBase))
 
+    _cached_name: typing.Optional[str] = program.cache_slot()
+
     @property
+    @program.cached_in('_cached_name')
     def name(self):
         return f'_{self.contained_type.name}_Ptr'
 
     @property
     def dependencies(self):
-        yield self.contained_type
+        return (self.contained_type,)
 
     def render_program_part(self):
         yield f'typedef {self.contained_type.name} *{self.name};'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class FunctionPointer(TypeBase):
     """Represents a function pointer types.
     """
     argument_types: typing.Sequence[TypeBase] = attr.ib(
-        validator=attr.validators.deep_iterable(
-            member_validator=attr.validators.instance_of(TypeBase),
-            iterable_validator=attr.validators.instance_of(tuple),
-        ),
+        validator=validators.members_instance_of(TypeBase),
         converter=tuple,
     )
     return_type: TypeBase = attr.ib(validator=attr.validators.instance_of(TypeBase))
 
+    _cached_name: typing.Optional[str] = program.cache_slot()
+
     @property
+    @program.cached_in('_cached_name')
     def name(self):
         arg_names = '_'.join(
             argument.name for argument in self.argument_types
@@ -75,8 +79,7 @@ class FunctionPointer(TypeBase):
 
     @property
     def dependencies(self):
-        yield from self.argument_types
-        yield self.return_type
+        return (*self.argument_types, self.return_type)
 
     def render_program_part(self):
         yield f'typedef {self.return_type.name} (*{self.name})('
@@ -90,13 +93,13 @@ class FunctionPointer(TypeBase):
         yield ');'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Struct(TypeBase):
     """Represents a struct type.
     """
 
-    @attr.s(frozen=True, slots=True)
-    class Field:
+    @attr.s(frozen=True, slots=True, cache_hash=True)
+    class Field(metaclass=instance_cache.InstanceCache):
         """Represents a named and typed struct field.
         """
         name: str = attr.ib(validator=attr.validators.instance_of(str))
@@ -106,17 +109,16 @@ class Struct(TypeBase):
         validator=attr.validators.instance_of(str),
     )
     fields: typing.Sequence[Field] = attr.ib(
-        validator=attr.validators.deep_iterable(
-            member_validator=attr.validators.instance_of(Field),
-            iterable_validator=attr.validators.instance_of(tuple),
-        ),
+        validator=validators.members_instance_of(Field),
         converter=tuple,
     )
 
+    _dependencies: typing.Optional[typing.Tuple[TypeBase, ...]] = program.cache_slot()
+
     @property
+    @program.cached_in('_dependencies', tuple)
     def dependencies(self):
-        for field in self.fields:
-            yield field.type
+        return (field.type for field in self.fields)
 
     def render_program_part(self):
         yield 'typedef struct {'
@@ -127,13 +129,13 @@ class Struct(TypeBase):
         yield '} ', self.name, ';'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Union(TypeBase):
     """Represents a union type.
     """
 
-    @attr.s(frozen=True, slots=True)
-    class Field:
+    @attr.s(frozen=True, slots=True, cache_hash=True)
+    class Field(metaclass=instance_cache.InstanceCache):
         """Represents a named and typed union field.
         """
         name: str = attr.ib(validator=attr.validators.instance_of(str))
@@ -143,17 +145,16 @@ class Union(TypeBase):
         validator=attr.validators.instance_of(str),
     )
     fields: typing.Sequence[Field] = attr.ib(
-        validator=attr.validators.deep_iterable(
-            member_validator=attr.validators.instance_of(Field),
-            iterable_validator=attr.validators.instance_of(tuple),
-        ),
+        validator=validators.members_instance_of(Field),
         converter=tuple,
     )
 
+    _dependencies: typing.Optional[typing.Tuple[TypeBase, ...]] = program.cache_slot()
+
     @property
+    @program.cached_in('_dependencies', tuple)
     def dependencies(self):
-        for field in self.fields:
-            yield field.type
+        return (field.type for field in self.fields)
 
     def render_program_part(self):
         yield 'typedef union {'
@@ -83,6 +83,7 @@ class TypesTestCase(unittest.TestCase):
             ],
             list(void_ptr.dependencies)
         )
+        self.assertIsInstance(void_ptr.dependencies, tuple)
 
     def test_function_pointer(self):
         function_pointer = types.FunctionPointer(
@@ -97,6 +98,7 @@ class TypesTestCase(unittest.TestCase):
             '__void_Ptr___void_Ptr_Ptr_Returns_void_FnPtr',
             function_pointer.name
         )
+        self.assertIs(function_pointer.name, function_pointer.name)
 
         self.assertEqual(
             [
@@ -148,6 +150,10 @@ class TypesTestCase(unittest.TestCase):
             ],
             list(struct.dependencies)
         )
+        self.assertIs(struct.dependencies, struct.dependencies)
+
+        self.assertIs(struct.fields[0], types.Struct.Field('hello', types.Void()))
+        self.assertNotEqual(struct.fields[0], types.Union.Field('hello', types.Void()))
 
     def test_union(self):
         union = types.Struct(
@@ -180,3 +186,11 @@ class TypesTestCase(unittest.TestCase):
             ],
             list(union.dependencies)
         )
+
+        union = types.Union(
+            name='Bar',
+            fields=[
+                types.Union.Field('hello', types.Void()),
+            ],
+        )
+        self.assertIs(union.dependencies, union.dependencies)
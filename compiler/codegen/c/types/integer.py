@@ -18,7 +18,7 @@ class IntBase(types.TypeBase, metaclass=abc.ABCMeta):
         return self._name
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class SizeT(IntBase):
     """Alias of one of the fundamental unsigned integer types.
 
@@ -34,7 +34,7 @@ class SizeT(IntBase):
         yield include.Include(path='stddef.h', builtin=True)
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class WCharT(IntBase):
     """Can represent the largest supported character set.
     """
@@ -57,14 +57,14 @@ class UCharBase(IntBase, metaclass=abc.ABCMeta):
         yield include.Include(path='uchar.h', builtin=True)
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Char16T(UCharBase):
     """Not smaller than char. At least 16 bits.
     """
     _name = 'char16_t'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Char32T(UCharBase):
     """Not smaller than char16_t. At least 32 bits.
     """
@@ -87,35 +87,35 @@ class FundamentalIntBase(IntBase, metaclass=abc.ABCMeta):
             yield f'typedef {name_with_spaces} {self.name};'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Char(FundamentalIntBase):
     """Exactly one byte in size. At least 8 bits.
     """
     _name = 'char'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Short(FundamentalIntBase):
     """Not smaller than char. At least 16 bits.
     """
     _name = 'short'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Int(FundamentalIntBase):
     """Not smaller than short. At least 16 bits.
     """
     _name = 'int'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Long(FundamentalIntBase):
     """Not smaller than int. At least 32 bits.
     """
     _name = 'long'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class LongLong(FundamentalIntBase):
     """Not smaller than long. At least 64 bits.
     """
@@ -137,14 +137,14 @@ class StdIntBase(IntBase, metaclass=abc.ABCMeta):
         yield include.Include(path='stdint.h', builtin=True)
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class IntMaxT(StdIntBase):
     """Integer type with the maximum width supported.
     """
     _name = 'intmax_t'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class IntPtrT(StdIntBase):
     """Integer type capable of holding a value converted from a void pointer
     and then be converted back to that type with a value that compares equal
@@ -153,35 +153,35 @@ class IntPtrT(StdIntBase):
     _name = 'intptr_t'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Int8T(StdIntBase):
     """Integer type with a width of exactly 8 bits.
     """
     _name = 'int8_t'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Int16T(StdIntBase):
     """Integer type with a width of exactly 16 bits.
     """
     _name = 'int16_t'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Int32T(StdIntBase):
     """Integer type with a width of exactly 32 bits.
     """
     _name = 'int32_t'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class Int64T(StdIntBase):
     """Integer type with a width of exactly 64 bits.
     """
     _name = 'int64_t'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class IntLeast8T(StdIntBase):
     """Integer type with a width of at least 8 bits.
     No other integer type exists with lesser size and at least the specified width.
@@ -189,7 +189,7 @@ class IntLeast8T(StdIntBase):
     _name = 'int_least8_t'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class IntLeast16T(StdIntBase):
     """Integer type with a width of at least 16 bits.
     No other integer type exists with lesser size and at least the specified width.
@@ -197,7 +197,7 @@ class IntLeast16T(StdIntBase):
     _name = 'int_least16_t'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class IntLeast32T(StdIntBase):
     """Integer type with a width of at least 32 bits.
     No other integer type exists with lesser size and at least the specified width.
@@ -205,7 +205,7 @@ class IntLeast32T(StdIntBase):
     _name = 'int_least32_t'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class IntLeast64T(StdIntBase):
     """Integer type with a width of at least 64 bits.
     No other integer type exists with lesser size and at least the specified width.
@@ -213,7 +213,7 @@ class IntLeast64T(StdIntBase):
     _name = 'int_least64_t'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class IntFast8T(StdIntBase):
     """Integer type with a width of at least 8 bits.
     At least as fast as any other integer type with at least the specified width.
@@ -221,7 +221,7 @@ class IntFast8T(StdIntBase):
     _name = 'int_fast8_t'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class IntFast16T(StdIntBase):
     """Integer type with a width of at least 16 bits.
     At least as fast as any other integer type with at least the specified width.
@@ -229,7 +229,7 @@ class IntFast16T(StdIntBase):
     _name = 'int_fast16_t'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class IntFast32T(StdIntBase):
     """Integer type with a width of at least 32 bits.
     At least as fast as any other integer type with at least the specified width.
@@ -237,7 +237,7 @@ class IntFast32T(StdIntBase):
     _name = 'int_fast32_t'
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, cache_hash=True)
 class IntFast64T(StdIntBase):
     """Integer type with a width of at least 64 bits.
     At least as fast as any other integer type with at least the specified width.
@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-import abc
-
 import attr
 
 
 @attr.s
-class Declarable(metaclass=abc.ABCMeta):
+class Declarable:
     """A Declarable is an object such as a function or a variable
     which can be declared within a namespace.
     """
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import abc
 import decimal
+import functools
 import typing
 
 import attr
@@ -25,18 +26,24 @@ class Expression(parser_module.Symbol, metaclass=abc.ABCMeta):
         """
 
     @property
-    def expressions(self) -> typing.Iterable[Expression]:
+    def expressions(self) -> typing.Sequence[Expression]:
         """Get all the expressions which this expression directly depends on,
         not including descendants of those expressions.
         """
-        yield from []
+        return ()
 
-    @property
-    def variable_assignments(self) -> typing.Iterable[Variable]:
+    @functools.cached_property
+    def variable_assignments(self) -> typing.Sequence[Variable]:
         """Get all the variable assignments that result from executing this expression.
+
+        Computed once from the (cached) results of the child expressions.
         """
+        variable_assignments = []
+
         for expression in self.expressions:
-            yield from expression.variable_assignments
+            variable_assignments.extend(expression.variable_assignments)
+
+        return tuple(variable_assignments)
 
 
 @attr.s
@@ -400,18 +407,22 @@ class Unpack(LValue):
 
     @property
     def expressions(self):
-        yield from self.lvalues
+        return self.lvalues
 
-    @property
-    def variable_assignments(self) -> typing.Iterable[Variable]:
-        """Iterate over all the variables which unpacking would assign to.
+    @functools.cached_property
+    def variable_assignments(self) -> typing.Sequence[Variable]:
+        """Get all the variables which unpacking would assign to.
         """
-        # https://github.com/python-attrs/attrs/issues/652
-        yield from super(Unpack, self).variable_assignments  # pylint: disable=super-with-arguments
+        variable_assignments = []
+
+        for lvalue in self.lvalues:
+            variable_assignments.extend(lvalue.variable_assignments)
 
         for lvalue in self.lvalues:
             if isinstance(lvalue, Variable):
-                yield lvalue
+                variable_assignments.append(lvalue)
+
+        return tuple(variable_assignments)
 
 
 @attr.s(frozen=True, slots=True)
@@ -450,7 +461,8 @@ class Parenthesized(Expression):
     @property
     def expressions(self):
         if self.expression is not None:
-            yield self.expression
+            return (self.expression,)
+        return ()
 
 
 @attr.s(frozen=True, slots=True)
@@ -524,11 +536,9 @@ class Operator(Expression, metaclass=abc.ABCMeta):
 
 
 @attr.s
-class UnaryOperator(Operator, metaclass=abc.ABCMeta):
-    """An operator which takes exactly one argument.
+class TokenOperator(Operator, metaclass=abc.ABCMeta):
+    """An operator which is written as a single Token.
     """
-    expression: typing.Optional[Expression] = attr.ib(default=None)
-
     token: typing.Type[parser_module.Token] = None  # override in subclass
 
     @classmethod
@@ -537,10 +547,22 @@ class UnaryOperator(Operator, metaclass=abc.ABCMeta):
             cls.token
         ]).new_from_symbol(cls(cursor=cursor))
 
+    @classmethod
+    def first_characters(cls):
+        return None if cls.token is None else cls.token.first_characters()
+
+
+@attr.s
+class UnaryOperator(TokenOperator, metaclass=abc.ABCMeta):
+    """An operator which takes exactly one argument.
+    """
+    expression: typing.Optional[Expression] = attr.ib(default=None)
+
     @property
     def expressions(self):
         if self.expression:
-            yield self.expression
+            return (self.expression,)
+        return ()
 
     def new_from_operand_stack(self, cursor, operands):
         if not operands:
@@ -550,26 +572,17 @@ class UnaryOperator(Operator, metaclass=abc.ABCMeta):
 
 
 @attr.s
-class BinaryOperator(Operator, metaclass=abc.ABCMeta):
+class BinaryOperator(TokenOperator, metaclass=abc.ABCMeta):
     """An operator which takes exactly one argument.
     """
     left: typing.Optional[Expression] = attr.ib(default=None)
     right: typing.Optional[Expression] = attr.ib(default=None)
 
-    token: typing.Type[parser_module.Token] = None  # override in subclass
-
-    @classmethod
-    def parse(cls, cursor):
-        return cursor.parse_one_symbol([
-            cls.token
-        ]).new_from_symbol(cls(cursor=cursor))
-
     @property
     def expressions(self):
-        if self.left is not None:
-            yield self.left
-        if self.right is not None:
-            yield self.right
+        if self.left is None:
+            return () if self.right is None else (self.right,)
+        return (self.left,) if self.right is None else (self.left, self.right)
 
     def new_from_operand_stack(self, cursor, operands):
         if len(operands) < 2:
@@ -591,6 +604,10 @@ class CallBase(Operator, metaclass=abc.ABCMeta):
     begin_token: typing.Type[parser_module.Symbol] = parser_module.Symbol
     end_token: typing.Type[parser_module.Symbol] = parser_module.Symbol
 
+    @classmethod
+    def first_characters(cls):
+        return cls.begin_token.first_characters()
+
     @classmethod
     def parse(cls, cursor):
         cursor = cursor.parse_one_symbol([
@@ -681,12 +698,10 @@ class Call(CallBase):
 
     @property
     def expressions(self):
-        if self.callable is not None:
-            yield self.callable
-        for argument in self.positional_arguments:
-            yield argument
-        for argument in self.keyword_arguments.values():
-            yield argument
+        expressions = [] if self.callable is None else [self.callable]
+        expressions.extend(self.positional_arguments)
+        expressions.extend(self.keyword_arguments.values())
+        return tuple(expressions)
 
     def new_from_operand_stack(self, cursor, operands):
         if len(operands) < 1:
@@ -729,10 +744,15 @@ class Dot(Operator, LValue):
 
         raise RuntimeError('this should be unreachable')
 
+    @classmethod
+    def first_characters(cls):
+        return '.'
+
     @property
     def expressions(self):
         if self.object is not None:
-            yield self.object
+            return (self.object,)
+        return ()
 
     def new_from_operand_stack(self, cursor, operands):
         if len(operands) < 1:
@@ -777,12 +797,10 @@ class Subscript(CallBase, LValue):
 
     @property
     def expressions(self):
-        if self.subscriptable is not None:
-            yield self.subscriptable
-        for argument in self.positional_arguments:
-            yield argument
-        for argument in self.keyword_arguments.values():
-            yield argument
+        expressions = [] if self.subscriptable is None else [self.subscriptable]
+        expressions.extend(self.positional_arguments)
+        expressions.extend(self.keyword_arguments.values())
+        return tuple(expressions)
 
     def new_from_operand_stack(self, cursor, operands):
         if len(operands) < 1:
@@ -1179,11 +1197,12 @@ class IfElse(Operator):
 
     @property
     def expressions(self):
-        yield self.condition
+        expressions = [self.condition]
         if self.true_value is not None:
-            yield self.true_value
+            expressions.append(self.true_value)
         if self.false_value is not None:
-            yield self.false_value
+            expressions.append(self.false_value)
+        return tuple(expressions)
 
 
 @attr.s(frozen=True, slots=True)
@@ -1243,7 +1262,8 @@ class Lambda(Operator):
     @property
     def expressions(self):
         if self.expression:
-            yield self.expression
+            return (self.expression,)
+        return ()
 
 
 @attr.s(frozen=True, slots=True)
@@ -1259,13 +1279,17 @@ class Assignment(BinaryOperator):
         left.assign(namespace, value)
         return value
 
-    @property
+    @functools.cached_property
     def variable_assignments(self):
-        # https://github.com/python-attrs/attrs/issues/652
-        yield from super(Assignment, self).variable_assignments  # pylint: disable=super-with-arguments
+        variable_assignments = []
+
+        for expression in self.expressions:
+            variable_assignments.extend(expression.variable_assignments)
 
         if isinstance(self.left, Variable):
-            yield self.left
+            variable_assignments.append(self.left)
+
+        return tuple(variable_assignments)
 
 
 @attr.s(frozen=True, slots=True)
@@ -1442,15 +1466,19 @@ class Comprehension(Operator):
 
     @property
     def expressions(self):
+        expressions = []
+
         for loop in self.loops:
-            yield loop.iterable
-            yield loop.receiver
+            expressions.append(loop.iterable)
+            expressions.append(loop.receiver)
 
         if self.value is not None:
-            yield self.value
+            expressions.append(self.value)
 
         if self.condition is not None:
-            yield self.condition
+            expressions.append(self.condition)
+
+        return tuple(expressions)
 
 
 @attr.s(frozen=True, slots=True)
@@ -1512,6 +1540,11 @@ class ExpressionParser(parser_module.Parser):
         parser_module.Always,
     )
 
+    # Most operators begin with a known character, so only try the ones which can match.
+    _prefix_operator_index = parser_module.SymbolIndex(prefix_operators)
+    _infix_operator_index = parser_module.SymbolIndex(infix_operators)
+    _immediate_operator_index = parser_module.SymbolIndex(immediate_operators)
+
     @classmethod
     def parse(cls, cursor,  # pylint: disable=arguments-differ
               stop_symbols: typing.Sequence[typing.Type[parser_module.Symbol]] = (),
@@ -1584,7 +1617,7 @@ class ExpressionParser(parser_module.Parser):
     @classmethod
     def _consume_prefix_operators(cls, cursor, operators):
         while True:
-            cursor = cursor.parse_one_symbol(cls.prefix_operators)
+            cursor = cursor.parse_one_symbol(cls._prefix_operator_index.candidates(cursor))
             if isinstance(cursor.last_symbol, Operator):
                 operators.append(cursor.last_symbol)
             else:
@@ -1595,7 +1628,7 @@ class ExpressionParser(parser_module.Parser):
                                 cursor,
                                 operators,
                                 operands):
-        cursor = cursor.parse_one_symbol(cls.infix_operators)
+        cursor = cursor.parse_one_symbol(cls._infix_operator_index.candidates(cursor))
 
         if isinstance(cursor.last_symbol, Operator):
             # Evaluate all the operators in the stack which bind more tightly.
@@ -1612,7 +1645,7 @@ class ExpressionParser(parser_module.Parser):
     @classmethod
     def _consume_immediate_operators(cls, cursor, operators, operands):
         while True:
-            cursor = cursor.parse_one_symbol(cls.immediate_operators)
+            cursor = cursor.parse_one_symbol(cls._immediate_operator_index.candidates(cursor))
 
             if isinstance(cursor.last_symbol, Operator):
                 # Evaluate all the operators in the stack which bind more tightly.
@@ -1170,6 +1170,7 @@ class CallTestCase(unittest.TestCase):
             ],
             list(call.expressions)
         )
+        self.assertIsInstance(call.expressions, tuple)
 
 
 class DotTestCase(unittest.TestCase):
@@ -59,7 +59,10 @@ class Module(parser_module.Symbol):
     def from_string(cls, code: str) -> Module:
         cursor = parser_module.Cursor(code.splitlines())
 
-        return cls.parse(cursor).last_symbol  # noqa
+        try:
+            return cls.parse(cursor).last_symbol  # noqa
+        finally:
+            cursor.clear_token_cache()
 
     @classmethod
     def parse(cls, cursor: parser_module.Cursor):
@@ -33,6 +33,10 @@ class ModuleTestCase(unittest.TestCase):
             ])
         )
 
+    def test_from_string_clears_token_cache(self):
+        my_module = module.Module.from_string('import foo\n')
+        self.assertEqual({}, my_module.cursor._token_cache)  # pylint: disable=protected-access
+
     def test_parse(self):
         self.assertEqual(
             module.Module.parse(
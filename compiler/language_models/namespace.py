@@ -23,11 +23,13 @@ class Namespace:
         return Namespace.Object(self)
 
     def lookup(self, name: str) -> typing.Any:
-        if name in self.declarations:
-            return self.declarations[name]
+        namespace = self
 
-        if self.parent:
-            return self.parent.lookup(name)
+        while namespace is not None:
+            declarations = namespace.declarations
+            if name in declarations:
+                return declarations[name]
+            namespace = namespace.parent
 
         raise KeyError(f'no such name {name!r}')
 
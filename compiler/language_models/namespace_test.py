@@ -42,6 +42,22 @@ class NamespaceTestCase(unittest.TestCase):
         with self.assertRaises(KeyError):
             child.lookup('something_else')
 
+    def test_lookup_deep(self):
+        root = namespace.Namespace()
+        root.declare('foo', 'root_foo')
+
+        leaf = root
+        for _ in range(5000):  # deeper than the recursion limit
+            leaf = namespace.Namespace(parent=leaf)
+
+        self.assertIs(
+            'root_foo',
+            leaf.lookup('foo')
+        )
+
+        with self.assertRaises(KeyError):
+            leaf.lookup('something_else')
+
     def test_as_object(self):
         my_namespace = namespace.Namespace()
         my_namespace.declare('foo', 'bar')
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import abc
 import contextlib
+import functools
 import typing
 
 import attr
@@ -37,51 +38,64 @@ class Statement(parser_module.Symbol, metaclass=abc.ABCMeta):
             return None
 
     @property
-    def receivers(self) -> typing.Iterable[expression_module.LValue]:
+    def receivers(self) -> typing.Sequence[expression_module.LValue]:
         """Get all the LValues this statement assigns to, not including
         assignments performed by statements within this statement.
+
+        Subclasses override this with a ``functools.cached_property``, since
+        statements are immutable once constructed.
         """
-        yield from []
+        return ()
 
     @property
-    def expressions(self) -> typing.Iterable[expression_module.Expression]:
+    def expressions(self) -> typing.Sequence[expression_module.Expression]:
         """Get all the Expressions this statement executes, not including
         expressions executed by statements within this statement, and not
         including expressions within those expressions.
         """
-        yield from []
+        return ()
 
     @property
-    def statements(self) -> typing.Iterable[Statement]:
+    def statements(self) -> typing.Sequence[Statement]:
         """Get all the statements within this statement, not including
         statements within those statements.
         """
-        yield from []
+        return ()
 
-    @property
-    def variable_assignments(self) -> typing.Iterable[expression_module.Variable]:
+    @functools.cached_property
+    def variable_assignments(self) -> typing.Sequence[expression_module.Variable]:
         """Get all the variable assignments that result from executing this statement.
+
+        Computed once from the (cached) results of the child statements and expressions.
         """
-        for lvalue in self.receivers:
-            if isinstance(lvalue, expression_module.Variable):
-                yield lvalue
+        variable_assignments = [
+            lvalue
+            for lvalue in self.receivers
+            if isinstance(lvalue, expression_module.Variable)
+        ]
 
         for expr in self.expressions:
-            yield from expr.variable_assignments
+            variable_assignments.extend(expr.variable_assignments)
 
         for statement in self.statements:
-            yield from statement.variable_assignments
+            variable_assignments.extend(statement.variable_assignments)
 
-    @property
-    def nonlocal_variables(self) -> typing.Iterable[expression_module.Variable]:
+        return tuple(variable_assignments)
+
+    @functools.cached_property
+    def nonlocal_variables(self) -> typing.Sequence[expression_module.Variable]:
         """Get all the ``nonlocal`` variable declarations.
         """
+        nonlocal_variables = []
+
         if isinstance(self, Nonlocal):
             self: Nonlocal
-            yield from self.variables
+            nonlocal_variables.extend(self.variables)
 
         for statement in self.statements:
-            yield from statement.nonlocal_variables
+            nonlocal_variables.extend(statement.nonlocal_variables)
+
+        return tuple(nonlocal_variables)
 
     @abc.abstractmethod
     def execute(self, namespace: namespace_module.Namespace) -> Statement.Outcome:
@@ -113,7 +127,7 @@ class Statement(parser_module.Symbol, metaclass=abc.ABCMeta):
 class Block(Statement):
     """A sequence of statements to be executed in order.
     """
-    statements: typing.Sequence[Statement] = attr.ib(converter=tuple, factory=list)
+    statements: typing.Sequence[Statement] = attr.ib(converter=tuple, default=())
 
     def execute(self, namespace):
         with Raise.Outcome.catch(self) as get_outcome:  # noqa, is used
@@ -207,9 +221,9 @@ class Declaration(Statement):
             declarable=symbol,
         ))
 
-    @property
+    @functools.cached_property
     def receivers(self):
-        yield self.declarable
+        return (self.declarable,)
 
 
 @attr.s(frozen=True, slots=True)
@@ -279,12 +293,9 @@ class Assignment(Statement):
             expression=expression,
         ))
 
-    @property
+    @functools.cached_property
     def expressions(self):
-        yield self.expression
-
-        for receiver in self.receivers:
-            yield receiver
+        return (self.expression, *self.receivers)
 
 
 @attr.s(frozen=True, slots=True)
@@ -321,9 +332,9 @@ class Expression(Statement):
             expression=expression,
         ))
 
-    @property
+    @functools.cached_property
     def expressions(self):
-        yield self.expression
+        return (self.expression,)
 
 
 @attr.s(frozen=True, slots=True)
@@ -409,16 +420,15 @@ class If(Statement):
             else_body=cursor.last_symbol,
         ))
 
-    @property
+    @functools.cached_property
     def expressions(self):
-        yield self.condition
+        return (self.condition,)
 
-    @property
+    @functools.cached_property
     def statements(self):
-        yield self.body
-
         if self.else_body is not None:
-            yield self.else_body
+            return (self.body, self.else_body)
+        return (self.body,)
 
 
 @attr.s(frozen=True, slots=True)
@@ -512,16 +522,15 @@ class While(Statement):
             else_body=cursor.last_symbol,
         ))
 
-    @property
+    @functools.cached_property
     def expressions(self):
-        yield self.condition
+        return (self.condition,)
 
-    @property
+    @functools.cached_property
     def statements(self):
-        yield self.body
-
         if self.else_body is not None:
-            yield self.else_body
+            return (self.body, self.else_body)
+        return (self.body,)
 
 
 @attr.s(frozen=True, slots=True)
@@ -632,21 +641,19 @@ class For(Statement):
             else_body=cursor.last_symbol,
         ))
 
-    @property
+    @functools.cached_property
     def expressions(self):
-        yield self.iterable
-        yield self.receiver
+        return (self.iterable, self.receiver)
 
-    @property
+    @functools.cached_property
     def receivers(self):
-        yield self.receiver
+        return (self.receiver,)
 
-    @property
+    @functools.cached_property
     def statements(self):
-        yield self.body
-
         if self.else_body is not None:
-            yield self.else_body
+            return (self.body, self.else_body)
+        return (self.body,)
 
 
 @attr.s(frozen=True, slots=True)
@@ -791,21 +798,21 @@ class With(Statement):
 
         return cursor.new_from_symbol(nest_context_managers(0))
 
-    @property
+    @functools.cached_property
     def receivers(self):
         if self.receiver is not None:
-            yield self.receiver
+            return (self.receiver,)
+        return ()
 
-    @property
+    @functools.cached_property
     def expressions(self):
-        yield self.context_manager
-
         if self.receiver is not None:
-            yield self.receiver
+            return (self.context_manager, self.receiver)
+        return (self.context_manager,)
 
-    @property
+    @functools.cached_property
     def statements(self):
-        yield self.body
+        return (self.body,)
 
 
 @attr.s(frozen=True, slots=True)
@@ -830,7 +837,7 @@ class Try(Statement):
         receiver: typing.Optional[expression_module.LValue] = attr.ib(default=None)
 
     body: Block = attr.ib()
-    exception_handlers: typing.Sequence[ExceptionHandler] = attr.ib(factory=tuple, converter=tuple)
+    exception_handlers: typing.Sequence[ExceptionHandler] = attr.ib(converter=tuple, default=())
     else_body: typing.Optional[Block] = attr.ib(default=None)
     finally_body: typing.Optional[Block] = attr.ib(default=None)
 
@@ -978,32 +985,40 @@ class Try(Statement):
             finally_body=finally_body,
         ))
 
-    @property
+    @functools.cached_property
     def receivers(self):
-        for exception_handler in self.exception_handlers:
-            if exception_handler.receiver is not None:
-                yield exception_handler.receiver
+        return tuple(
+            exception_handler.receiver
+            for exception_handler in self.exception_handlers
+            if exception_handler.receiver is not None
+        )
 
-    @property
+    @functools.cached_property
     def expressions(self):
+        expressions = []
+
         for exception_handler in self.exception_handlers:
-            yield exception_handler.exception
+            expressions.append(exception_handler.exception)
 
             if exception_handler.receiver is not None:
-                yield exception_handler.receiver
+                expressions.append(exception_handler.receiver)
 
-    @property
+        return tuple(expressions)
+
+    @functools.cached_property
     def statements(self):
-        yield self.body
+        statements = [self.body]
 
         for exception_handler in self.exception_handlers:
-            yield exception_handler.body
+            statements.append(exception_handler.body)
 
         if self.else_body is not None:
-            yield self.else_body
+            statements.append(self.else_body)
 
         if self.finally_body is not None:
-            yield self.finally_body
+            statements.append(self.finally_body)
+
+        return tuple(statements)
 
 
 @attr.s(frozen=True, slots=True)
@@ -1095,10 +1110,11 @@ class Raise(Statement):
             expression=expression,
         ))
 
-    @property
+    @functools.cached_property
     def expressions(self):
         if self.expression is not None:
-            yield self.expression
+            return (self.expression,)
+        return ()
 
 
 @attr.s(frozen=True, slots=True)
@@ -1148,15 +1164,16 @@ class Return(Statement):
             expression=expression,
         ))
 
-    @property
+    @functools.cached_property
     def expressions(self):
         if self.expression is not None:
-            yield self.expression
+            return (self.expression,)
+        return ()
 
 
 @attr.s(frozen=True, slots=True)
 class Nonlocal(Statement):
-    variables: typing.Sequence[expression_module.Variable] = attr.ib(factory=tuple, converter=tuple)
+    variables: typing.Sequence[expression_module.Variable] = attr.ib(converter=tuple, default=())
 
     def execute(self, namespace):
         # TODO: namespace needs to support nonlocal
@@ -1191,9 +1208,9 @@ class Nonlocal(Statement):
             variables=variables
         ))
 
-    @property
+    @functools.cached_property
     def expressions(self):
-        yield from self.variables
+        return self.variables
 
 
 @attr.s(frozen=True, slots=True)
@@ -1230,10 +1247,11 @@ class Assert(Statement):
             expression=expression,
         ))
 
-    @property
+    @functools.cached_property
     def expressions(self):
         if self.expression is not None:
-            yield self.expression
+            return (self.expression,)
+        return ()
 
 
 @attr.s(frozen=True, slots=True)
@@ -2308,6 +2308,12 @@ class TryTestCase(unittest.TestCase):
             list(try_statement.statements)
         )
 
+        # Statements are immutable, so the children are only computed once.
+        self.assertIs(
+            try_statement.statements,
+            try_statement.statements
+        )
+
 
 class RaiseTestCase(unittest.TestCase):
     def test_parse(self):
@@ -21,13 +21,32 @@ class Parser(metaclass=abc.ABCMeta):
         """
 
 
-@attr.s(frozen=True, slots=True)
+@attr.s(frozen=True, slots=True, eq=False)
 class Cursor:
     _lines: typing.Sequence[str] = attr.ib(converter=tuple, repr=False)
     line: int = attr.ib(default=0)
     column: int = attr.ib(default=0)
     last_symbol: typing.Optional[Symbol] = attr.ib(default=None)
     block_depth: int = attr.ib(default=0)
+    # Shared by all the cursors derived from this one (see ``parse_token``). Nodes keep
+    # their cursors, so clear it with ``clear_token_cache`` once the parse is done.
+    _token_cache: typing.MutableMapping[tuple, typing.Optional[Cursor]] = attr.ib(
+        factory=dict, eq=False, repr=False)
+
+    def __eq__(self, other):
+        # Compare the cheap fields first; lines are usually the identical tuple.
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.line == other.line
+            and self.column == other.column
+            and self.block_depth == other.block_depth
+            and self.last_symbol == other.last_symbol
+            and (self._lines is other._lines or self._lines == other._lines)
+        )
+
+    def __hash__(self):
+        return hash((self.line, self.column, self.block_depth, self.last_symbol))
 
     def line_text(self, line=None):
         line = self.line if line is None else line
@@ -42,27 +61,74 @@ class Cursor:
     def new_from_symbol(self, symbol: Symbol):
         """Get a new cursor from an existing cursor and a symbol.
         """
-        if isinstance(symbol, (BeginBlock, EndBlock)):
+        # isinstance goes through ABCMeta.__instancecheck__ for Symbols, which is slow
+        # enough to matter here, so classify each Symbol type once.
+        symbol_type = type(symbol)
+        try:
+            is_block_token, is_token = _symbol_kinds[symbol_type]
+        except KeyError:
+            is_block_token = issubclass(symbol_type, (BeginBlock, EndBlock))
+            is_token = issubclass(symbol_type, Token)
+            _symbol_kinds[symbol_type] = is_block_token, is_token
+
+        if is_block_token:
             block_depth = symbol.block_depth
         else:
             block_depth = self.block_depth
 
-        if isinstance(symbol, Token):
+        if is_token:
             line = symbol.next_line
             column = symbol.next_column
         else:
             line = self.line
             column = self.column
 
-        return Cursor(
-            lines=self._lines,
-            # Only allow one extra line (for cases where the file
-            # doesn't end in a newline).
-            line=min(line, self.last_line + 1),
-            column=column,
-            last_symbol=symbol,
-            block_depth=block_depth,
-        )
+        # This is the hottest constructor in the parser, and every field is already
+        # known to be valid, so bypass the attrs __init__ (keyword handling and the
+        # lines converter) and set the slots directly.
+        cursor = _new_object(Cursor)
+        _set_attribute(cursor, '_lines', self._lines)
+        # Only allow one extra line (for cases where the file
+        # doesn't end in a newline).
+        _set_attribute(cursor, 'line', min(line, self.last_line + 1))
+        _set_attribute(cursor, 'column', column)
+        _set_attribute(cursor, 'last_symbol', symbol)
+        _set_attribute(cursor, 'block_depth', block_depth)
+        _set_attribute(cursor, '_token_cache', self._token_cache)
+        return cursor
+
+    def parse_token(self,
+                    token_type: typing.Type[Token],
+                    match_token: typing.Callable[[Cursor], typing.Optional[Token]]) -> typing.Optional[Cursor]:
+        """Parse a Token, reusing the result of any earlier attempt to parse the
+        same type of Token at the same position (packrat memoization).
+
+        The parser backtracks a lot, so the same Token is often tried repeatedly at
+        the same position. This is only valid for Tokens which depend on nothing but
+        the text at the cursor position and the block depth.
+
+        :param token_type: the type of Token to parse, part of the cache key
+        :param match_token: returns a Token found at the cursor, or None
+        :return: a new Cursor object, or None if there is no match
+        """
+        key = (token_type, self.line, self.column, self.block_depth)
+        try:
+            return self._token_cache[key]
+        except KeyError:
+            pass
+
+        token = match_token(self)
+        cursor = self._token_cache[key] = None if token is None else self.new_from_symbol(token)
+        return cursor
+
+    def clear_token_cache(self):
+        """Forget the Tokens remembered by ``parse_token``, for this cursor and every
+        cursor sharing its cache.
+
+        Call this once parsing is finished, so the cache is not kept alive by the
+        cursors stored in the parsed Symbols.
+        """
+        self._token_cache.clear()
 
     def parse_one_symbol(self, one_of: typing.Sequence[typing.Type[Symbol]], fail=False) -> Cursor:
         """Parse one Symbol, returning a new Cursor object.
@@ -98,6 +164,13 @@ class Cursor:
             expected_symbols=one_of,
         )
 
+    def next_character(self) -> str:
+        """Get the character at which the next token would begin, after any blank lines
+        and spaces (or the empty string at the end of the file).
+        """
+        cursor = _eat_newlines(self)
+        return cursor.line_text()[cursor.column:].lstrip(' ')[:1]
+
     def __str__(self):
         heading = f'{self.line + 1}, {self.column + 1}: '
         line_text = self.line_text()
@@ -134,6 +207,48 @@ class Symbol(Parser, metaclass=abc.ABCMeta):
     def symbol_name(cls):
         return cls.__name__
 
+    @classmethod
+    def first_characters(cls) -> typing.Optional[str]:
+        """Get the characters which a match could begin with (after any blank lines
+        and spaces), or None if a match could begin with anything.
+        """
+        return None
+
+
+@attr.s(frozen=True, slots=True)
+class SymbolIndex:
+    """Index a sequence of Symbol types by ``first_characters``, so that Symbols which
+    cannot match the next character are not tried at all.
+    """
+    symbols: typing.Sequence[typing.Type[Symbol]] = attr.ib(converter=tuple)
+    _by_character: typing.Mapping[str, typing.Sequence[typing.Type[Symbol]]] = attr.ib(
+        init=False, eq=False, repr=False)
+    _any_character: typing.Sequence[typing.Type[Symbol]] = attr.ib(init=False, eq=False, repr=False)
+
+    @_by_character.default
+    def _init_by_character(self):
+        characters = {
+            character
+            for symbol in self.symbols
+            for character in symbol.first_characters() or ''
+        }
+        return {
+            character: tuple(
+                symbol for symbol in self.symbols
+                if symbol.first_characters() is None or character in symbol.first_characters()
+            )
+            for character in characters
+        }
+
+    @_any_character.default
+    def _init_any_character(self):
+        return tuple(symbol for symbol in self.symbols if symbol.first_characters() is None)
+
+    def candidates(self, cursor: Cursor) -> typing.Sequence[typing.Type[Symbol]]:
+        """Get the Symbols which could match at the cursor, in their original order.
+        """
+        return self._by_character.get(cursor.next_character(), self._any_character)
+
 
 @attr.s(frozen=True, slots=True)
 class Always(Symbol):
@@ -310,7 +425,7 @@ class MultilineWhitespace(Token):
 @generic.Generic
 def Regex(pattern):  # noqa
     # pylint: disable=invalid-name
-    compiled_pattern = regex.compile(fr'^ *({pattern})(?:$|\b|(?=\W))', regex.V1)
+    compiled_pattern = regex.compile(fr' *({pattern})(?:$|\b|(?=\W))', regex.V1)
 
     @attr.s(frozen=True, slots=True)
     class Regex(Token):  # noqa
@@ -323,22 +438,24 @@ def Regex(pattern):  # noqa
 
         @classmethod
         def parse(cls, cursor: Cursor):
-            while True:  # Eat newlines.
-                new_cursor = cursor.parse_one_symbol([EndLine, Always])
-                if new_cursor.line == cursor.line:
-                    break
-                cursor = new_cursor
+            return cursor.parse_token(cls, cls.match_token)
 
-            match = compiled_pattern.match(cursor.line_text()[cursor.column:])
+        @classmethod
+        def match_token(cls, cursor: Cursor) -> typing.Optional[Regex]:
+            """Get the token matching the pattern at the cursor, if any.
+            """
+            cursor = _eat_newlines(cursor)
+            # Match in place rather than slicing the line, which would copy it.
+            match = compiled_pattern.match(cursor.line_text(), cursor.column)
 
             if match:
-                return cursor.new_from_symbol(cls(
+                return cls(
                     first_line=cursor.line,
                     next_line=cursor.line,
-                    first_column=cursor.column + match.start(1),
-                    next_column=cursor.column + match.end(1),
+                    first_column=match.start(1),
+                    next_column=match.end(1),
                     groups=match.groups(),
-                ))
+                )
 
             return None
 
@@ -349,6 +466,10 @@ def Regex(pattern):  # noqa
 def Characters(characters):  # noqa
     # pylint: disable=invalid-name
 
+    # The regex would require a word boundary after the characters. That can only fail
+    # if the characters end in a word character, and are followed by a word character.
+    needs_word_boundary = bool(_WORD_CHARACTER_REGEX.match(characters[-1:]))
+
     @attr.s(frozen=True, slots=True, repr=False)
     class Characters(Regex[regex.escape(characters)]):  # noqa
         # pylint: disable=redefined-outer-name
@@ -356,6 +477,32 @@ def Characters(characters):  # noqa
         def symbol_name(cls):
             return repr(characters)
 
+        @classmethod
+        def first_characters(cls):
+            return characters[:1] or None
+
+        @classmethod
+        def match_token(cls, cursor: Cursor):
+            # Fixed strings don't need the regex machinery: str.startswith is enough.
+            cursor = _eat_newlines(cursor)
+            line_text = cursor.line_text()
+            first_column = len(line_text) - len(line_text[cursor.column:].lstrip(' '))
+            next_column = first_column + len(characters)
+
+            if not line_text.startswith(characters, first_column):
+                return None
+
+            if needs_word_boundary and _WORD_CHARACTER_REGEX.match(line_text, next_column):
+                return None
+
+            return cls(
+                first_line=cursor.line,
+                next_line=cursor.line,
+                first_column=first_column,
+                next_column=next_column,
+                groups=(characters,),
+            )
+
     return Characters
 
 
@@ -382,10 +529,21 @@ class String(Symbol):
 
     @classmethod
     def parse(cls, cursor):
-        cursor = cursor.parse_one_symbol([
+        string_types = [
             MultilineString,
             OneLineString,
-        ])
+        ]
+
+        start = _STRING_START_REGEX.match(cursor.line_text(), cursor.column)
+        if start is None:
+            return None  # Not a string; skip trying the string tokens.
+        if start.group('quote') in ('"', "'"):
+            string_types = [
+                OneLineString,
+            ]
+        # Otherwise, if there is no quote, the string may start on a later line.
+
+        cursor = cursor.parse_one_symbol(string_types)
 
         if isinstance(cursor.last_symbol, (OneLineString, MultilineString)):
             return cursor.new_from_symbol(cls(
@@ -449,21 +607,23 @@ class MultilineString(Token):
         is_formatted = 'f' in prefix
         quote = cursor.last_symbol.groups[2]  # noqa
 
-        while True:
-            cursor = cursor.parse_one_symbol([
-                Characters[quote],  # end quote always wins
-                Regex[r'(?:\\.|[^\\\'"])+'],  # escaped characters and non-quote characters
-                Regex[r'\\$'],  # escaped newline
-                Regex[r'[\'"]'],  # one quote character (results in non-greedy behavior)
-            ])
-
-            if isinstance(cursor.last_symbol, Characters[quote]):
-                break
+        # Scan forward line by line for the first end quote which is not escaped.
+        next_line = cursor.line
+        next_column = _find_end_quote(cursor.line_text(next_line), quote, cursor.column)
+        while next_column < 0:
+            next_line += 1
+            if next_line > cursor.last_line:
+                raise NoMatchError(
+                    message='unterminated multiline string',
+                    cursor=initial_cursor,
+                    expected_symbols=[Characters[quote]],
+                )
+            next_column = _find_end_quote(cursor.line_text(next_line), quote, 0)
+
+        cursor = attr.evolve(cursor, line=next_line, column=next_column)
 
         first_line = initial_cursor.line
-        next_line = cursor.line
         first_column = initial_cursor.last_symbol.first_column  # noqa
-        next_column = cursor.column
 
         content_lines = [
             cursor.line_text(line)[
@@ -508,6 +668,39 @@ class MultilineString(Token):
         ))
 
 
+def _eat_newlines(cursor: Cursor) -> Cursor:
+    """Skip past the ends of any blank or comment-only lines.
+    """
+    # Every token starts by eating newlines, so check for the end of the line with
+    # one regex match before trying EndLine (the past-the-end line never ends).
+    while cursor.line <= cursor.last_line and _END_LINE_REGEX.match(cursor.line_text()[cursor.column:]):
+        cursor = EndLine.parse(cursor)
+    return cursor
+
+
+def _find_end_quote(line_text: str, quote: str, column: int) -> int:
+    """Find the first occurrence of ``quote`` at or after ``column`` which is not
+    escaped by a backslash.
+
+    :return: the column just past the end quote, or -1 if there is none on this line
+    """
+    scan_column = column
+    while True:
+        quote_column = line_text.find(quote, scan_column)
+        if quote_column < 0:
+            return -1
+
+        # The quote is escaped if it follows an odd number of backslashes.
+        escape_column = quote_column
+        while escape_column > column and line_text[escape_column - 1] == '\\':
+            escape_column -= 1
+
+        if (quote_column - escape_column) % 2 == 0:
+            return quote_column + len(quote)
+
+        scan_column = quote_column + 1
+
+
 def _measure_block_depth(cursor):
     """Measure the block depth for the current line number.
 
@@ -515,17 +708,17 @@ def _measure_block_depth(cursor):
 
     :raises IndentationError: on bad indentation
     """
-    match = _INDENT_REGEX.match(cursor.line_text())
+    line_text = cursor.line_text()
+    indentation = len(line_text) - len(line_text.lstrip(' '))
 
-    if match.group(2):  # group(2) matches tabs
+    if line_text[indentation:indentation + 1].isspace():  # tabs or other whitespace after the spaces
         raise IndentationError(
             cursor=cursor,
             message='each block must be indented four spaces (other whitespace found)',
             line=cursor.line,
-            column=match.start(2),  # first other space character
+            column=indentation,  # first other space character
         )
 
-    indentation = match.end()
     block_depth, remainder = divmod(indentation, 4)
 
     if remainder:
@@ -547,6 +740,14 @@ def _measure_block_depth(cursor):
     return block_depth
 
 
+# Matches the start of a string (some distinct combination of ``b``, ``f``, and ``r``,
+# then a quote), or the end of the line, after which a string may still begin.
+_STRING_START_REGEX = regex.compile(r' *(?:(?:bf?r?|br?f?|fb?r?|fr?b|rb?f?|rf?b?|)(?P<quote>"""|\'\'\'|[\'"])|#|$)')
+
+_new_object = object.__new__
+_set_attribute = object.__setattr__
+_symbol_kinds: typing.Dict[type, typing.Tuple[bool, bool]] = {}  # type -> (is block token, is token)
+
 _END_LINE_REGEX = regex.compile(r'^ *(#.*)?$')
-_INDENT_REGEX = regex.compile(r'^( *)(\s*)')
 _WHITESPACE_REGEX = regex.compile(r'^\s+')
+_WORD_CHARACTER_REGEX = regex.compile(r'\w', regex.V1)
@@ -18,6 +18,16 @@ class ParserTestCase(unittest.TestCase):
         self.assertEqual('world', cursor.line_text(1))
         self.assertEqual('', cursor.line_text(2))
 
+    def test_eq(self):
+        cursor = parser_module.Cursor(lines=['foo', 'bar'], line=1, column=2)
+
+        self.assertEqual(cursor, parser_module.Cursor(lines=['foo', 'bar'], line=1, column=2))
+        self.assertEqual(hash(cursor), hash(parser_module.Cursor(lines=['foo', 'bar'], line=1, column=2)))
+        self.assertNotEqual(cursor, parser_module.Cursor(lines=['foo', 'baz'], line=1, column=2))
+        self.assertNotEqual(cursor, parser_module.Cursor(lines=['foo', 'bar'], line=1, column=1))
+        self.assertNotEqual(cursor, parser_module.Cursor(lines=['foo', 'bar'], line=1, column=2, block_depth=1))
+        self.assertNotEqual(cursor, (('foo', 'bar'), 1, 2, None, 0))
+
     def test_last_line(self):
         cursor = parser_module.Cursor(
             lines=[
@@ -267,6 +277,85 @@ class ParserTestCase(unittest.TestCase):
             parser_module.BlankLine,  # matches
         ])
 
+    def test_next_character(self):
+        self.assertEqual('b', parser_module.Cursor(lines=['foo  bar'], column=3).next_character())
+        self.assertEqual('b', parser_module.Cursor(lines=['foo  # comment', '', ' bar'], column=3).next_character())
+        self.assertEqual('', parser_module.Cursor(lines=['foo  '], column=3).next_character())
+
+    def test_symbol_index(self):
+        symbol_index = parser_module.SymbolIndex([
+            parser_module.Characters['+='],
+            parser_module.Identifier,
+            parser_module.Characters['+'],
+            parser_module.Characters['-'],
+            parser_module.Always,
+        ])
+
+        self.assertEqual(
+            (
+                parser_module.Characters['+='],
+                parser_module.Identifier,
+                parser_module.Characters['+'],
+                parser_module.Always,
+            ),
+            symbol_index.candidates(parser_module.Cursor(lines=[' + 1'])),
+        )
+        self.assertEqual(
+            (
+                parser_module.Identifier,
+                parser_module.Always,
+            ),
+            symbol_index.candidates(parser_module.Cursor(lines=['foo'])),
+        )
+
+    def test_parse_token_cached(self):
+        calls = []
+
+        def match_foo(cursor):
+            calls.append(cursor)
+            return parser_module.Characters['foo'].match_token(cursor)
+
+        cursor = parser_module.Cursor(
+            lines=[
+                'foo bar',
+            ],
+        )
+
+        new_cursor = cursor.parse_token(parser_module.Characters['foo'], match_foo)
+        self.assertEqual(3, new_cursor.column)
+        self.assertIs(
+            new_cursor,
+            cursor.parse_token(parser_module.Characters['foo'], match_foo),
+        )
+        self.assertEqual(1, len(calls))
+
+        # Failures are remembered as well.
+        self.assertIsNone(new_cursor.parse_token(parser_module.Characters['foo'], match_foo))
+        self.assertIsNone(new_cursor.parse_token(parser_module.Characters['foo'], match_foo))
+        self.assertEqual(2, len(calls))
+
+    def test_clear_token_cache(self):
+        calls = []
+
+        def match_foo(cursor):
+            calls.append(cursor)
+            return parser_module.Characters['foo'].match_token(cursor)
+
+        cursor = parser_module.Cursor(
+            lines=[
+                'foo bar',
+            ],
+        )
+
+        new_cursor = cursor.parse_token(parser_module.Characters['foo'], match_foo)
+        # The cache is shared, so clearing it from a derived cursor clears it for all.
+        new_cursor.clear_token_cache()
+        self.assertEqual(
+            new_cursor,
+            cursor.parse_token(parser_module.Characters['foo'], match_foo),
+        )
+        self.assertEqual(2, len(calls))
+
 
 class TokenTestCase(unittest.TestCase):
     def test_end_file(self):
@@ -832,6 +921,28 @@ class TokenTestCase(unittest.TestCase):
             )
         )
 
+    def test_regex_mid_line(self):
+        # Matching starts at the cursor column, regardless of what precedes it.
+        self.assertEqual(
+            parser_module.Identifier.parse(
+                parser_module.Cursor(
+                    lines=['foo.bar  baz'],
+                    column=5,
+                )
+            ),
+            parser_module.Cursor(
+                lines=['foo.bar  baz'],
+                column=7,
+                last_symbol=parser_module.Identifier(
+                    first_line=0,
+                    next_line=0,
+                    first_column=5,
+                    next_column=7,
+                    groups=['ar'],
+                ),
+            )
+        )
+
     def test_regex_capture(self):
         self.assertEqual(
             parser_module.Regex['(b)?a+'].parse(
@@ -1283,6 +1394,31 @@ class TokenTestCase(unittest.TestCase):
         self.assertEqual(string.cursor.last_symbol.first_column, 1)
         self.assertEqual(string.cursor.last_symbol.next_column, 6)
 
+    def test_string_not_a_string(self):
+        for line in ['foo', 'bb"foo"', 'R"foo"', 'rb', 'frbf"foo"']:
+            self.assertIsNone(
+                parser_module.String.parse(
+                    parser_module.Cursor(
+                        lines=[line],
+                    )
+                ),
+                line,
+            )
+
+    def test_string_next_line(self):
+        string = parser_module.String.parse(
+            parser_module.Cursor(
+                lines=['  # comment', ' frb"foo"'],
+            )
+        ).last_symbol
+        self.assertEqual(
+            parser_module.String(
+                value=b'foo',
+                is_formatted=True,
+            ),
+            string
+        )
+
     def test_string_escape(self):
         string = parser_module.String.parse(
             parser_module.Cursor(
@@ -1526,9 +1662,49 @@ class TokenTestCase(unittest.TestCase):
                 ])
             )
 
+    def test_multiline_string_end_quote(self):
+        # Escaped quotes do not end the string.
+        self.assertEqual(
+            parser_module.String.parse(
+                parser_module.Cursor([
+                    r'"""a \""" b \\"""',
+                ])
+            ).last_symbol,
+            parser_module.String(
+                value='a """ b \\',
+                is_formatted=False,
+            )
+        )
+
+        # Comment characters are part of the string.
+        self.assertEqual(
+            parser_module.String.parse(
+                parser_module.Cursor([
+                    '""" # not a comment """',
+                ])
+            ).last_symbol,
+            parser_module.String(
+                value=' # not a comment ',
+                is_formatted=False,
+            )
+        )
+
 
 class HelpersTestCase(unittest.TestCase):
     # pylint: disable=protected-access
+    def test_eat_newlines(self):
+        cursor = parser_module._eat_newlines(parser_module.Cursor(lines=['foo  # comment', '', '  bar'], column=3))
+        self.assertEqual((2, 0), (cursor.line, cursor.column))
+        self.assertIsInstance(cursor.last_symbol, parser_module.EndLine)
+
+        cursor = parser_module.Cursor(lines=['foo bar'], column=3)
+        self.assertIs(cursor, parser_module._eat_newlines(cursor))
+
+        # Stops on the (empty) line past the end.
+        cursor = parser_module._eat_newlines(parser_module.Cursor(lines=['foo', '  '], column=3))
+        self.assertEqual((2, 0), (cursor.line, cursor.column))
+        self.assertIs(cursor, parser_module._eat_newlines(cursor))
+
     def test_measure_block_depth(self):
         self.assertEqual(
             0,
@@ -1571,6 +1747,15 @@ class HelpersTestCase(unittest.TestCase):
                 )
             )
 
+        with self.assertRaises(parser_module.IndentationError) as context:
+            parser_module._measure_block_depth(
+                parser_module.Cursor(
+                    lines=['    \thello'],
+                )
+            )
+
+        self.assertEqual(4, context.exception.column)  # points at the tab
+
     def test_measure_block_depth_remainder(self):
         with self.assertRaisesRegex(parser_module.IndentationError, 'extra spaces found'):
             parser_module._measure_block_depth(
@@ -0,0 +1,22 @@
+"""Validators for use with attrs.
+"""
+
+
+def members_instance_of(member_type):
+    """Validator for a tuple or frozenset (already converted) of ``member_type``.
+
+    Equivalent to ``attr.validators.deep_iterable`` with ``instance_of`` validators,
+    but checks all the members in one pass instead of one validator call per member.
+    """
+    def validate(_, attribute, value):
+        for member in value:
+            if not isinstance(member, member_type):
+                raise TypeError(
+                    f"'{attribute.name}' must be {member_type!r} "
+                    f"(got {member!r} that is a {member.__class__!r}).",
+                    attribute,
+                    member_type,
+                    member,
+                )
+
+    return validate
@@ -0,0 +1,26 @@
+import unittest
+
+import attr
+
+from . import validators
+
+
+class ValidatorsTestCase(unittest.TestCase):
+    def test_members_instance_of(self):
+        @attr.s(frozen=True, slots=True)
+        class Class:
+            members: tuple = attr.ib(
+                validator=validators.members_instance_of(int),
+                converter=tuple,
+            )
+
+        self.assertEqual((1, 2, 3), Class([1, 2, 3]).members)
+        self.assertEqual((), Class([]).members)
+
+        with self.assertRaises(TypeError) as exc:
+            Class([1, '2', 3])
+
+        self.assertEqual(
+            "'members' must be <class 'int'> (got '2' that is a <class 'str'>).",
+            exc.exception.args[0],
+        )